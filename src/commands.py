@@ -3,55 +3,112 @@ Module for processing and managing robot commands.
 Implements command queuing and operation tracking.
 """
 
-from collections import deque
-from typing import Optional, List, Deque
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, Optional, List
+
+_INITIAL_CAPACITY = 16  # Must be a power of two so a mask can replace modulo
 
 class CommandProcessor:
     """
     Processes and manages robot commands using queue and stack data structures.
     Handles command validation and operation sequencing.
+    Both structures are preallocated slot pools that only grow by doubling.
+    The queue is safe for one producer thread (enqueue_*) and one consumer
+    thread (everything else) without locks: each index has a single writer,
+    and the tail is only published after the slot has been written.
     """
 
+    __slots__ = ('_queue', '_head', '_tail', '_stack', '_stack_top', '_last_command')
+
     def __init__(self):
         """
-        Initialise command processor with queue and stack structures.
+        Initialise command processor with ring-buffer queue and slot-pool stack.
         """
-        self._command_queue: Deque[str] = deque()  # Queue for incoming commands
-        self._operation_stack: List[str] = []      # Stack for tracking operations
+        self._queue: List[Optional[str]] = [None] * _INITIAL_CAPACITY  # Ring buffer
+        # Monotonic counters, masked by the buffer length on access
+        self._head = 0  # Next command to read, owned by the consumer
+        self._tail = 0  # Next command to write, owned by the producer
+        self._stack: List[Optional[str]] = [None] * _INITIAL_CAPACITY  # Operation pool
+        self._stack_top = 0  # Number of tracked operations
         self._last_command: Optional[str] = None
 
     def enqueue_command(self, command: str) -> bool:
         """
         Add a command to the processing queue.
+        Commands are interned so repeated commands share one string object.
         Args: command Command to be queued
-        Returns: bool - True if command was queued successfully
+        Returns: bool - True if command was queued successfully, False if it is not a string
         """
+        if not isinstance(command, str):
+            return False
         try:
-            self._command_queue.append(command)
+            command = sys.intern(command)
+            tail = self._tail
+            if tail - self._head == len(self._queue):
+                self._grow_queue(tail + 1 - self._head)
+            queue = self._queue
+            queue[tail & (len(queue) - 1)] = command
+            self._tail = tail + 1  # Publish only after the slot is written
             return True
         except (MemoryError, RuntimeError):
             return False
 
+    def enqueue_many(self, commands: Iterable[str]) -> int:
+        """
+        Add a batch of commands to the processing queue in order.
+        Grows the ring once up front, then copies in at most two slices.
+        Items that are not strings are skipped, as enqueue_command rejects them.
+        Args: commands - Commands to be queued
+        Returns: int - Number of commands queued
+        """
+        batch = [sys.intern(command) for command in commands if isinstance(command, str)]
+        tail = self._tail
+        needed = tail - self._head + len(batch)
+        if needed > len(self._queue):
+            self._grow_queue(needed)
+
+        queue = self._queue
+        start = tail & (len(queue) - 1)
+        first = min(len(batch), len(queue) - start)
+        queue[start:start + first] = batch[:first]
+        queue[:len(batch) - first] = batch[first:]  # Wrapped remainder
+        self._tail = tail + len(batch)
+        return len(batch)
+
     def process_next_command(self) -> Optional[str]:
         """
         Process the next command in the queue.
         Returns: str or None - Next command if available, None if queue is empty
         """
-        if self._command_queue:
-            command = self._command_queue.popleft()  # FIFO queue behaviour
+        head = self._head
+        if head != self._tail:
+            queue = self._queue  # Read the mask from the same buffer we index
+            slot = head & (len(queue) - 1)
+            command = queue[slot]  # FIFO queue behaviour
+            queue[slot] = None  # Drop the reference before the producer may reuse the slot
+            self._head = head + 1
             self._last_command = command
-            self._operation_stack.append(command)    # Track operation
+
+            # Track operation inline to avoid a method call per command
+            stack = self._stack
+            top = self._stack_top
+            if top == len(stack):
+                stack.extend([None] * top)  # Double the pool
+            stack[top] = command
+            self._stack_top = top + 1
             return command
         return None
 
     def undo_last_operation(self) -> Optional[str]:
         """
         Pop the last operation from the stack.
-        
+
         Returns: str or None - Last operation if available, None if stack is empty
         """
-        if self._operation_stack:
-            return self._operation_stack.pop()  # LIFO stack behaviour
+        if self._stack_top:
+            self._stack_top -= 1  # LIFO stack behaviour
+            return self._stack[self._stack_top]
         return None
 
     def get_operation_history(self) -> List[str]:
@@ -59,24 +116,58 @@ class CommandProcessor:
         Get the history of operations.
         Returns: list - List of operations in chronological order
         """
-        return self._operation_stack.copy()
+        return self._stack[:self._stack_top]
+
+    def iter_operation_history(self) -> Iterator[str]:
+        """
+        Iterate over the history of operations without copying it.
+        The iterator is only valid until the stack is next modified.
+        Returns: iterator - Operations in chronological order
+        """
+        return islice(self._stack, self._stack_top)
 
     def clear_queue(self) -> None:
         """
         Clear all pending commands from the queue.
-        """
-        self._command_queue.clear()
+        Slots are emptied before the head moves past them, so the producer
+        never has a reused slot cleared under it.
+        """
+        queue = self._queue
+        mask = len(queue) - 1
+        tail = self._tail
+        for index in range(self._head, tail):
+            queue[index & mask] = None
+        self._head = tail
 
     def queue_size(self) -> int:
         """
         Get the number of commands waiting in the queue.
         Returns: int - Number of queued commands
         """
-        return len(self._command_queue)
+        return self._tail - self._head
 
     def stack_size(self) -> int:
         """
         Get the number of operations in the stack.
         Returns: int - Number of tracked operations
         """
-        return len(self._operation_stack)
+        return self._stack_top
+
+    def _grow_queue(self, needed: int) -> None:
+        """
+        Double the queue capacity until it can hold the needed number of commands.
+        Pending commands are copied to their slots in a new buffer before it is
+        swapped in, so a concurrent consumer always reads a consistent buffer.
+        Args: needed - Number of commands the queue must be able to hold
+        """
+        old = self._queue
+        old_mask = len(old) - 1
+        capacity = len(old) * 2
+        while capacity < needed:
+            capacity *= 2
+
+        queue: List[Optional[str]] = [None] * capacity
+        mask = capacity - 1
+        for index in range(self._head, self._tail):
+            queue[index & mask] = old[index & old_mask]
+        self._queue = queue
@@ -3,13 +3,61 @@ This module contains the abstract base class for the robot system.
 AbstractRobot serves as a template that defines behaviour all robot implementations must provide.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional
+from array import array
+from enum import IntEnum
+from typing import Dict, FrozenSet, Optional, Tuple
 from src.safety import SafetyController
 from src.environment import EnvironmentMonitor
 from src.motion import RobotMotion
 from src.object_handling import ObjectHandler
 
+# Command vocabulary interned to small integer IDs
+CMD_WALK, CMD_TURN, CMD_GRASP, CMD_STOP, CMD_RELEASE, CMD_RESET = range(6)
+
+_CMD_TABLE = {
+    "walk": CMD_WALK,
+    "turn": CMD_TURN,
+    "grasp": CMD_GRASP,
+    "stop": CMD_STOP,
+    "release": CMD_RELEASE,
+    "reset": CMD_RESET
+}
+
+class State(IntEnum):
+    """
+    Operational states of the robot.
+    Ordinals index the per-state lookup tables on Robot.
+    """
+    IDLE = 0
+    WALKING = 1
+    TURNING = 2
+    GRASPING = 3
+    ERROR = 4
+
+    @property
+    def label(self) -> str:
+        """
+        Get the display label for this state.
+        Returns: str - State name as shown to users (e.g., 'Idle')
+        """
+        return self.name.capitalize()
+
+def _build_valid_masks(valid_commands: Dict[State, FrozenSet[str]]) -> Tuple[int, ...]:
+    """
+    Convert a table of allowed command words into per-state bitmasks.
+    Args: valid_commands - Allowed command words for each state
+    Returns: tuple - Bitmask of allowed command IDs, indexed by State ordinal
+    """
+    return tuple(sum(1 << _CMD_TABLE[command] for command in valid_commands[state])
+                 for state in State)
+
+# State ordinal in the low bits, operational flag in bit 31
+_STATE_MASK = 0xFF
+_OPERATIONAL_BIT = 1 << 31
+
 # pylint: disable=too-many-instance-attributes
 
 class AbstractRobot(ABC):
@@ -18,13 +66,15 @@ class AbstractRobot(ABC):
     Structure for robot implementations, ensuring consistent behaviour across robot types.
     """
 
+    __slots__ = ('_state_flags', '_last_command')
+
     def __init__(self):
         """
         Initialise the abstract robot.
         Sets up basic attributes that all robots will need.
         """
-        self._current_state = "Idle"  # Robots always start in Idle state
-        self._is_operational = False  # Safety first - starts non-operational
+        # Robots always start in Idle state and, safety first, non-operational
+        self._state_flags = int(State.IDLE)
         self._last_command = None     # Track the most recent command
 
     @abstractmethod
@@ -58,7 +108,7 @@ class AbstractRobot(ABC):
         Check if the robot is currently operational.
         Returns: bool - True if robot is operational, False otherwise
         """
-        return self._is_operational
+        return bool(self._state_flags & _OPERATIONAL_BIT)
 
     @property
     def current_state(self) -> str:
@@ -66,7 +116,24 @@ class AbstractRobot(ABC):
         Get the current state of the robot.
         Returns: str - Current robot state
         """
-        return self._current_state
+        return State(self._state_flags & _STATE_MASK).label
+
+    def _set_state(self, state: State) -> None:
+        """
+        Update the state bits, keeping the operational flag.
+        Args: state - New operational state
+        """
+        self._state_flags = (self._state_flags & ~_STATE_MASK) | state
+
+    def _set_operational(self, operational: bool) -> None:
+        """
+        Update the operational flag, keeping the state bits.
+        Args: operational - True if the robot is operational
+        """
+        if operational:
+            self._state_flags |= _OPERATIONAL_BIT
+        else:
+            self._state_flags &= ~_OPERATIONAL_BIT
 
 class Robot(AbstractRobot):
     """
@@ -74,6 +141,19 @@ class Robot(AbstractRobot):
     Coordinates all robot subsystems and implements required abstract methods.
     """
 
+    __slots__ = ('_safety', '_environment', '_motion', '_object_handler',
+                 '_pose', '_held_object')
+
+    # Commands allowed in each state, shared by all instances
+    _VALID_COMMANDS: Dict[State, FrozenSet[str]] = {
+        State.IDLE: frozenset(("walk", "turn", "grasp")),
+        State.WALKING: frozenset(("stop", "turn")),
+        State.TURNING: frozenset(("stop", "walk")),
+        State.GRASPING: frozenset(("release",)),
+        State.ERROR: frozenset(("reset",))
+    }
+    _VALID_MASK = _build_valid_masks(_VALID_COMMANDS)
+
     def __init__(self):
         """
         Initialise the robot with all required subsystems.
@@ -85,8 +165,8 @@ class Robot(AbstractRobot):
         self._environment = EnvironmentMonitor()
         self._motion = RobotMotion()
         self._object_handler = ObjectHandler()
-        self._current_position = [0, 0, 0]  # x, y, z coordinates
-        self._current_orientation = [0, 0, 0]  # roll, pitch, yaw
+        # x, y, z position then roll, pitch, yaw orientation, stored as raw doubles
+        self._pose = array('d', [0.0] * 6)
         self._held_object = None  # ID of object currently being held
 
     def initialise(self) -> bool:
@@ -95,24 +175,37 @@ class Robot(AbstractRobot):
         Returns: bool - True if initialisation successful, False otherwise
         """
         try:
-            # Check all subsystems
-            if (self._safety.initialise() and self._environment and
-                self._motion and self._object_handler):
-                self._is_operational = True
-                self._current_state = "Idle"
-                return True
-            return False
+            ready = self._check_subsystems()
         except (AttributeError, RuntimeError):
-            self._is_operational = False
-            self._current_state = "Error"
+            self._set_operational(False)
+            self._set_state(State.ERROR)
             return False
 
+        if ready:
+            self._arm()
+        return ready
+
+    def _check_subsystems(self) -> bool:
+        """
+        Check that every subsystem is present and safety initialises.
+        Returns: bool - True if all subsystems are ready
+        """
+        return bool(self._safety.initialise() and self._environment and
+                    self._motion and self._object_handler)
+
+    def _arm(self) -> None:
+        """
+        Mark the robot operational and ready in the Idle state.
+        """
+        self._set_operational(True)
+        self._set_state(State.IDLE)
+
     def get_current_state(self) -> str:
         """
         Get the robot's current operational state.
         Returns: str - Current state of the robot
         """
-        return self._current_state
+        return self.current_state
 
     def validate_command(self, command: str) -> bool:
         """
@@ -120,18 +213,34 @@ class Robot(AbstractRobot):
         Args: command - Command to validate
         Returns: bool - True if command is valid, False otherwise
         """
-        if not self.is_operational:
+        return self.validate_command_id(_CMD_TABLE.get(command, -1))
+
+    def validate_command_id(self, cmd_id: int) -> bool:
+        """
+        Check if an interned command ID can be executed in the current state.
+        Args: cmd_id - Command ID from the command table, -1 if unknown
+        Returns: bool - True if command is valid, False otherwise
+        """
+        flags = self._state_flags
+        if not flags & _OPERATIONAL_BIT or cmd_id < 0:
             return False
+        return bool(self._VALID_MASK[flags & _STATE_MASK] & (1 << cmd_id))
 
-        valid_commands = {
-            "Idle": ["walk", "turn", "grasp"],
-            "Walking": ["stop", "turn"],
-            "Turning": ["stop", "walk"],
-            "Grasping": ["release"],
-            "Error": ["reset"]
-        }
+    @property
+    def position(self) -> memoryview:
+        """
+        Get a writable view of the robot's position.
+        Returns: memoryview - x, y, z coordinates backed by the pose buffer
+        """
+        return memoryview(self._pose)[:3]
 
-        return command in valid_commands.get(self._current_state, [])
+    @property
+    def orientation(self) -> memoryview:
+        """
+        Get a writable view of the robot's orientation.
+        Returns: memoryview - roll, pitch, yaw backed by the pose buffer
+        """
+        return memoryview(self._pose)[3:]
 
     def grip_object(self, object_id: int) -> bool:
         """
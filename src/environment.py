@@ -3,42 +3,83 @@ Module for environmental monitoring and sensor data processing.
 Simulates sensor data for robot environment awareness.
 """
 
-from typing import Dict, List
+from array import array
+from typing import Dict, List, TypedDict
 from src.interfaces import ISensing
 
+_HISTORY_SIZE = 10  # Number of scans kept in the reading ring
+
+# Index of each direction in the measure_distances() buffer
+DIR_FRONT, DIR_LEFT, DIR_RIGHT, DIR_BACK = range(4)
+DISTANCE_DIRECTIONS = ("front", "left", "right", "back")
+
+class ScanResult(TypedDict):
+    """
+    Sensor data produced by EnvironmentMonitor.scan().
+    Distances are in centimetres.
+    """
+    front_distance: float
+    left_distance: float
+    right_distance: float
+    obstacles_detected: int
+    is_path_clear: bool
+
 class EnvironmentMonitor(ISensing):
     """
     Monitors and processes environmental data for the robot.
     Implements ISensing interface for environment interaction.
     """
 
+    __slots__ = ('_sensor_readings', '_ring_idx', '_dist_buf', '_obstacles',
+                 '_environment_map', '_last_scan_time')
+
     def __init__(self):
         """
         Initialise the environment monitor with empty sensor readings.
+        Reading and distance dicts are preallocated and reused for every scan.
         """
-        self._sensor_readings: List[Dict] = []
-        self._obstacle_positions: List[List[float]] = []
+        self._sensor_readings: List[ScanResult] = [
+            {
+                'front_distance': 0.0,
+                'left_distance': 0.0,
+                'right_distance': 0.0,
+                'obstacles_detected': 0,
+                'is_path_clear': True
+            } for _ in range(_HISTORY_SIZE)
+        ]
+        self._ring_idx = 0  # Slot the next scan will overwrite
+        self._dist_buf = array('d', [0.0] * len(DISTANCE_DIRECTIONS))
+        # Obstacle coordinates packed as contiguous x, y, z triples of doubles
+        self._obstacles = array('d')
         self._environment_map: Dict = {}
         self._last_scan_time = 0
 
-    def scan(self) -> Dict:
+    def scan(self) -> ScanResult:
         """
         Perform an environment scan.
         Simulates sensor data collection from robot's surroundings.
+        The returned dict is a history slot and is overwritten after 10 more scans,
+        so callers that keep it longer should copy it.
         Returns: dict - Simulated sensor data including distances and obstacles
         """
+        sensor_data = self._sensor_readings[self._ring_idx]
+        self._ring_idx = (self._ring_idx + 1) % _HISTORY_SIZE
 
-        sensor_data = {
-            'front_distance': 100.0,  # cm
-            'left_distance': 100.0,   # cm
-            'right_distance': 100.0,  # cm
-            'obstacles_detected': len(self._obstacle_positions),
-            'is_path_clear': True
-        }
-
-        self._sensor_readings.append(sensor_data)
+        sensor_data['front_distance'] = 100.0  # cm
+        sensor_data['left_distance'] = 100.0   # cm
+        sensor_data['right_distance'] = 100.0  # cm
+        sensor_data['obstacles_detected'] = len(self._obstacles) // 3
+        sensor_data['is_path_clear'] = True
         return sensor_data
 
+    def add_obstacle(self, position: List[float]) -> None:
+        """
+        Record an obstacle at the given position.
+        Args: position - Obstacle [x, y, z] position in centimetres
+        """
+        x, y, z = position
+        self._obstacles.extend((x, y, z))
+
     def detect(self) -> List:
         """
         Detect objects in the environment.
@@ -53,27 +94,30 @@ class EnvironmentMonitor(ISensing):
         # For now, returns an empty list indicating no objects detected
         return detected_objects
 
-    def measure_distances(self) -> Dict[str, float]:
+    def measure_distances(self) -> array:
         """
         Measure distances in all directions.
-        
-        Returns: dict - Distances in centimetres for each direction
+        The same buffer is refreshed on every call; copy it to keep a snapshot.
+        Returns: array - Distances in centimetres, indexed by DIR_FRONT..DIR_BACK
         """
         # Simulate distance measurements
-        return {
-            'front': 100.0,
-            'left': 100.0,
-            'right': 100.0,
-            'back': 100.0
-        }
+        dist = self._dist_buf
+        dist[DIR_FRONT] = 100.0
+        dist[DIR_LEFT] = 100.0
+        dist[DIR_RIGHT] = 100.0
+        dist[DIR_BACK] = 100.0
+        return dist
+
+    def measure_distances_dict(self) -> Dict[str, float]:
+        """
+        Measure distances in all directions, keyed by direction name.
+        Returns: dict - Distances in centimetres for each direction
+        """
+        return dict(zip(DISTANCE_DIRECTIONS, self.measure_distances()))
 
     def update_sensor_data(self) -> None:
         """
         Update stored sensor data with new readings.
+        scan() records the reading, overwriting the oldest slot in the ring.
         """
-        new_scan = self.scan()
-        self._sensor_readings.append(new_scan)
-
-        # Keep only the last 10 readings
-        if len(self._sensor_readings) > 10:
-            self._sensor_readings.pop(0)
+        self.scan()
@@ -1,16 +1,22 @@
 """
 This module defines the core interfaces for the robot system.
 Each interface establishes a contract that implementing classes must fulfil.
+Interfaces are structural protocols, so isinstance checks match on methods provided,
+while explicit subclasses must still implement every abstract method.
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol, runtime_checkable
 
-class IGrippable(ABC):
+@runtime_checkable
+class IGrippable(Protocol):
     """
     Interface for objects that can perform gripping actions.
     Ensures implementing classes provide methods for gripping & releasing objects safely.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def grip(self) -> bool:
         """
@@ -25,12 +31,15 @@ class IGrippable(ABC):
         Returns: bool - True if release successful, False otherwise
         """
 
-class IMoveable(ABC):
+@runtime_checkable
+class IMoveable(Protocol):
     """
     Interface for objects that can perform movement operations.
     Ensures implementing classes provide methods for controlled movement & stopping.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def move(self) -> bool:
         """
@@ -46,12 +55,15 @@ class IMoveable(ABC):
         """
 
 
-class ISensing(ABC):
+@runtime_checkable
+class ISensing(Protocol):
     """
     Interface for objects that can perform environmental sensing.
     Ensures implementing classes provide methods for scanning environment & detecting objects.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def scan(self) -> dict:
         """
@@ -1,90 +1,112 @@
 """
 Main CLI interface for the humanoid robot control system.
 Provides command-line interaction with robot and navigation capabilities.
+Run from the repository root with: python -m src.main
 """
 
+import re
 import sys
-import os
-from typing import List
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Tuple
 
+from src.commands import CommandProcessor
 from src.core import Robot
-from src.navigation import NavigationSystem
+from src.navigation import DIRECTIONS, NavigationSystem
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_HELP_TEXT = "\n".join((
+    "",
+    "Commands:",
+    "  walk <direction> <steps> - e.g., 'walk north-west 150'",
+    "  scan    - Check surroundings",
+    "  detect  - Look for nearby objects",
+    "  grasp   - Pick up object",
+    "  release - Let go of object",
+    "  next    - Move to next area (when current area is complete)",
+    "  help    - Show commands",
+    "  quit    - Exit",
+    "",
+    "Directions: north, north-east, east, south-east, south, south-west, west, north-west",
+    ""
+))
+
+_UNKNOWN_DIRECTION = "\nUnknown direction. Use one of: " + ", ".join(DIRECTIONS)
+
+# Whole-number step count, checked up front instead of catching int() failures
+_STEPS_RE = re.compile(r"[+-]?\d+")
 
 def display_help() -> None:
     """Display available commands and their usage."""
-    print("\nCommands:")
-    print("  walk <direction> <steps> - e.g., 'walk north-west 150'")
-    print("  scan    - Check surroundings")
-    print("  detect  - Look for nearby objects")
-    print("  grasp   - Pick up object")
-    print("  release - Let go of object")
-    print("  next    - Move to next area (when current area is complete)")
-    print("  help    - Show commands")
-    print("  quit    - Exit")
-    print("\nDirections: north, north-east, east, south-east, south, south-west, west, north-west")
-
-def handle_movement(parts: List[str], navigation: NavigationSystem, robot: Robot) -> None:
+    sys.stdout.write(_HELP_TEXT)
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of output lines with a single stdout call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Handlers share one signature, so not every handler uses every argument
+# pylint: disable=unused-argument
+
+def handle_movement(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
     """Handle walk <direction> <steps> command."""
-    try:
-        if len(parts) != 3:
-            print("\nInvalid command. Use 'walk <direction> <steps>'")
-            return
-
-        direction = parts[1]
-        steps = int(parts[2])
-
-        if navigation.walk(direction, steps):
-            print(f"\nMoving {steps} steps {direction}")
-            current_pos = navigation.position
-            print(f"Now at position ({current_pos[0]:.0f}, {current_pos[1]:.0f})")
-
-            # Only check for objects if not carrying anything
-            if robot.get_held_object() is None:
-                nearby = navigation.get_nearby_objects(max_distance=100)
-                if nearby:
-                    for obj_id in nearby:
-                        print(f"Object {obj_id} is within gripping range")
-            else:
-                # When carrying object, check if at storage bay
-                if navigation.is_at_storage_bay(navigation.position):
-                    print("At storage bay - use 'release' to store object")
-        else:
-            if robot.get_held_object() is not None:
-                print("\nCannot move away from storage bay while carrying object")
-            else:
-                print("\nCannot move there - path blocked or outside safe area")
-    except ValueError:
+    _, direction, steps_text = parts
+    if direction not in DIRECTIONS:
+        print(_UNKNOWN_DIRECTION)
+        return
+    if _STEPS_RE.fullmatch(steps_text) is None:
         print("\nInvalid number of steps. Use whole numbers only")
+        return
+    steps = int(steps_text)
 
-def handle_object_detection(navigation: NavigationSystem) -> None:
+    if navigation.walk(direction, steps):
+        current_pos = navigation.position
+        lines = [f"\nMoving {steps} steps {direction}",
+                 f"Now at position ({current_pos[0]:.0f}, {current_pos[1]:.0f})"]
+
+        # Only check for objects if not carrying anything
+        if robot.get_held_object() is None:
+            nearby = navigation.get_nearby_objects(max_distance=100)
+            lines.extend(f"Object {obj_id} is within gripping range" for obj_id in nearby)
+        else:
+            # When carrying object, check if at storage bay
+            if navigation.is_at_storage_bay(current_pos):
+                lines.append("At storage bay - use 'release' to store object")
+        write_lines(lines)
+    else:
+        if robot.get_held_object() is not None:
+            print("\nCannot move away from storage bay while carrying object")
+        else:
+            print("\nCannot move there - path blocked or outside safe area")
+
+def handle_object_detection(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
     """Handle object detection command."""
     nearby = navigation.get_nearby_objects(max_distance=150)
     if nearby:
-        print("\nObjects within reach:")
+        lines = ["\nObjects within reach:"]
+        get_steps = navigation.get_steps_to_object
         for obj_id, distance in nearby.items():
-            direction, steps = navigation.get_steps_to_object(obj_id)
-            print(f"Object {obj_id}: {steps} steps {direction}")
+            direction, steps = get_steps(obj_id)
+            lines.append(f"Object {obj_id}: {steps} steps {direction}")
             if distance <= 100:
-                print("- Within gripping range")
+                lines.append("- Within gripping range")
+        write_lines(lines)
     else:
         print("\nNo objects within reach")
 
-def handle_object_interaction(command: str, robot: Robot, navigation: NavigationSystem) -> None:
+def handle_object_interaction(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
     """Handle grasp and release commands with storage tracking."""
+    command = parts[0]
     if command == "grasp":
         # First check if we can reach any objects
         grippable = navigation.get_nearby_objects(max_distance=100)
         if grippable:
-            print("\nAttempting to grip nearest object...")
-            nearest_object = min(grippable.keys())
+            nearest_object = min(grippable.items(), key=itemgetter(1))[0]
+            lines = ["\nAttempting to grip nearest object..."]
 
             if robot.grip_object(nearest_object):  # Pass the object ID to grip_object
-                print(f"Successfully gripped Object {nearest_object}")
-                print("Use 'scan' to see path to storage bay")
+                lines.append(f"Successfully gripped Object {nearest_object}")
+                lines.append("Use 'scan' to see path to storage bay")
             else:
-                print("Failed to grip object")
+                lines.append("Failed to grip object")
+            write_lines(lines)
         else:
             print("\nNo objects within reach. Move closer to an object and try again")
 
@@ -96,58 +118,142 @@ def handle_object_interaction(command: str, robot: Robot, navigation: Navigation
             if navigation.is_at_storage_bay(navigation.position):
                 robot.release_object()
                 all_stored = navigation.store_object(held_object)
-                print(f"\nObject {held_object} stored in storage bay")
+                lines = [f"\nObject {held_object} stored in storage bay"]
 
                 if all_stored:
-                    print("\nAll objects in this area have been stored!")
-                    print("Type 'next' to move to new area")
+                    lines.append("\nAll objects in this area have been stored!")
+                    lines.append("Type 'next' to move to new area")
                 else:
-                    remaining = len(navigation.get_available_objects())
-                    print(f"{remaining} objects remaining")
+                    remaining = navigation.available_count()
+                    lines.append(f"{remaining} objects remaining")
             else:
                 robot.release_object()
-                print("\nObject released outside storage bay")
-                print("Note: Object must be released at storage bay to be stored")
+                lines = ["\nObject released outside storage bay",
+                         "Note: Object must be released at storage bay to be stored"]
+            write_lines(lines)
         else:
             print("\nNo object currently held")
 
-def handle_scan(navigation: NavigationSystem, robot: Robot) -> None:
+def handle_scan(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
     """Show current position and relevant navigation information."""
-    print("\nScanning surroundings...")
     pos = navigation.position
-    print(f"Current position: ({pos[0]:.0f}, {pos[1]:.0f})")
+    lines = ["\nScanning surroundings...", f"Current position: ({pos[0]:.0f}, {pos[1]:.0f})"]
 
     held_object = robot.get_held_object()
     if held_object is not None:
         # Show storage bay location
         direction, steps = navigation.get_steps_to_storage()
-        print(f"\nCarrying Object {held_object}")
-        print(f"Storage Bay: {steps} steps {direction}")
+        lines.append(f"\nCarrying Object {held_object}")
+        lines.append(f"Storage Bay: {steps} steps {direction}")
     else:
         # When not carrying anything, show available objects
         available = navigation.get_available_objects()
         if available:
-            print("\nAvailable Objects:")
+            lines.append("\nAvailable Objects:")
             nearby = navigation.get_nearby_objects(max_distance=100)
-            for obj_id, pos in available.items():
-                direction, steps = navigation.get_steps_to_object(obj_id)
-                status = "GRIPPABLE" if obj_id in nearby else "out of reach"
-                print(f"Object {obj_id}: {steps} steps {direction} ({status})")
+            get_steps = navigation.get_steps_to_object
+            for obj_id in available:
+                distance = nearby.get(obj_id)
+                direction, steps = get_steps(obj_id)
+                status = "GRIPPABLE" if distance is not None else "out of reach"
+                lines.append(f"Object {obj_id}: {steps} steps {direction} ({status})")
         else:
-            print("\nAll objects stored. Ready for next area")
+            lines.append("\nAll objects stored. Ready for next area")
+    write_lines(lines)
 
-def handle_where(navigation: NavigationSystem) -> None:
+def handle_where(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
     """Handle where command."""
-    for obj_id in navigation.objects:
-        direction, steps = navigation.get_steps_to_object(obj_id)
-        print(f"Object {obj_id}: {steps} steps {direction}")
+    lines = [f"Object {obj_id}: {steps} steps {direction}"
+             for obj_id, (direction, steps) in navigation.get_steps_to_objects().items()]
+    if lines:
+        write_lines(lines)
+
+def handle_status(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
+    """Handle status command."""
+    print(f"Position: ({navigation.position[0]:.0f}, {navigation.position[1]:.0f})")
+
+def handle_next_area(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
+    """Handle next command."""
+    if navigation.all_objects_stored():
+        write_lines(["\nMoving to next area...", "Next area functionality to be implemented"])
+    else:
+        print("\nCannot move to next area until all objects are stored")
+
+def handle_help(parts: List[str], robot: Robot, navigation: NavigationSystem) -> None:
+    """Handle help command."""
+    display_help()
+
+_UNKNOWN_COMMAND = "\nUnknown command. Type 'help' for available commands"
+
+# Command keyword -> (handler, number of parts including the keyword).
+# Handlers are only called with the expected arity, as handler(parts, robot, navigation)
+CMD_TABLE: Dict[str, Tuple[Callable[[List[str], Robot, NavigationSystem], None], int]] = {
+    "walk": (handle_movement, 3),
+    "scan": (handle_scan, 1),
+    "detect": (handle_object_detection, 1),
+    "grasp": (handle_object_interaction, 1),
+    "release": (handle_object_interaction, 1),
+    "where": (handle_where, 1),
+    "status": (handle_status, 1),
+    "next": (handle_next_area, 1),
+    "help": (handle_help, 1)
+}
+
+# Commands typed exactly as their keyword skip the regex and split entirely
+_BARE_COMMANDS = {keyword: handler for keyword, (handler, arity) in CMD_TABLE.items() if arity == 1}
+
+# Message shown when a command is given the wrong number of arguments
+_USAGE = {
+    "walk": "\nInvalid command. Use 'walk <direction> <steps>'"
+}
+
+_PROMPT = "\nEnter command: "
+
+# Compiled once, for normalised lines: a known keyword, then either the end of the
+# line or whitespace and the arguments, so e.g. 'walk-east' is not read as 'walk'
+_COMMAND_RE = re.compile(
+    r"(" + "|".join(map(re.escape, CMD_TABLE)) + r")(?:\s+(.*))?\Z",
+    re.DOTALL
+)
+
+def normalise_command(line: str) -> str:
+    """
+    Strip surrounding whitespace and lower-case a command line.
+    Both steps return the line itself when there is nothing to change, so
+    already-normalised input (the common case) is not copied.
+    """
+    command = line.strip()
+    return command if command.islower() else command.lower()
+
+def read_commands() -> Iterator[str]:
+    """Yield raw command lines, prompting only when stdin is a terminal."""
+    if sys.stdin.isatty():
+        while True:
+            try:
+                yield input(_PROMPT)
+            except EOFError:
+                return
+    else:
+        # Scripted input is read in one call and drained from the queue without prompts.
+        # Flush first so the banner is not held back while waiting on a slow pipe.
+        sys.stdout.flush()
+        processor = CommandProcessor()
+        processor.enqueue_many(sys.stdin.read().splitlines())
+        command = processor.process_next_command()
+        while command is not None:
+            yield command
+            command = processor.process_next_command()
 
-# pylint: disable=too-many-branches
 def main() -> None:
     """Main control loop for robot system."""
     robot = Robot()
     navigation = NavigationSystem()
 
+    # Scripted runs need no per-line flush even when stdout is a terminal;
+    # read_commands() flushes before blocking and the rest is flushed on exit
+    if not sys.stdin.isatty() and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("\n=== Robot Control System ===")
     if not robot.initialise():
         print("Robot initialisation failed.")
@@ -156,42 +262,36 @@ def main() -> None:
     navigation.explain_workspace()
     display_help()
 
-    while True:
-        try:
-            command = input("\nEnter command: ").strip().lower()
-            parts = command.split()
-
-            if not parts:
+    try:
+        for line in read_commands():
+            command = normalise_command(line)
+            if not command:
                 continue
-
             if command == "quit":
                 break
+            handler = _BARE_COMMANDS.get(command)
+            if handler is not None:
+                handler([command], robot, navigation)
+                continue
 
-            if command == "help":
-                display_help()
-            elif command == "status":
-                print(f"Position: ({navigation.position[0]:.0f}, {navigation.position[1]:.0f})")
-            elif command == "where":
-                handle_where(navigation)
-            elif command == "scan":
-                handle_scan(navigation, robot)
-            elif command == "detect":
-                handle_object_detection(navigation)
-            elif command in ["grasp", "release"]:
-                handle_object_interaction(command, robot, navigation)
-            elif parts[0] == "walk":
-                handle_movement(parts, navigation, robot)
-            elif command == "next":
-                if len(navigation.stored_objects) == len(navigation.objects):
-                    print("\nMoving to next area...")
-                    print("Next area functionality to be implemented")
-                else:
-                    print("\nCannot move to next area until all objects are stored")
-            else: print("\nUnknown command. Type 'help' for available commands")
+            match = _COMMAND_RE.match(command)
+            if match is None:
+                print(_UNKNOWN_COMMAND)
+                continue
+
+            keyword, rest = match.groups()
+            keyword = sys.intern(keyword)
+            args = [sys.intern(arg) for arg in rest.split()] if rest else []
+
+            entry = CMD_TABLE.get(keyword)
+            parts = [keyword, *args]
+            if entry is not None and len(parts) == entry[1]:
+                entry[0](parts, robot, navigation)
+            else:
+                print(_USAGE.get(keyword, _UNKNOWN_COMMAND))
 
-        except KeyboardInterrupt:
-            print("\nShutting down robot system...")
-            break
+    except KeyboardInterrupt:
+        print("\nShutting down robot system...")
 
 if __name__ == "__main__":
     main()
@@ -12,6 +12,8 @@ class RobotMotion(IMoveable):
     Implements IMoveable interface for motion control.
     """
 
+    __slots__ = ('_walking_speed', '_turning_angle', '_safety_boundaries', '_is_moving')
+
     def __init__(self):
         """
         Initialise motion controller with default parameters.
@@ -4,140 +4,337 @@ Handles position tracking, movement planning and spatial awareness.
 """
 
 import math
-from typing import Tuple, Dict, List, Optional
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+from typing import Tuple, Dict, List, Mapping, Optional, Sequence
 
-# pylint: disable=too-many-instance-attributes
+# Diagonal compass directions, indexed by (dx > 0) + 2 * (dy > 0)
+_DIAGONALS = ("south-west", "south-east", "north-west", "north-east")
+_STEP_CM = 10.0  # Length of one step in centimetres
+_DIAG_CM = _STEP_CM / math.sqrt(2.0)  # Per-axis distance of one diagonal step
+
+# Walking direction -> (dx, dy) of a single step in centimetres
+_DIR_STEP = {
+    "north": (0.0, _STEP_CM),
+    "south": (0.0, -_STEP_CM),
+    "east": (_STEP_CM, 0.0),
+    "west": (-_STEP_CM, 0.0),
+    "north-east": (_DIAG_CM, _DIAG_CM),
+    "north-west": (-_DIAG_CM, _DIAG_CM),
+    "south-east": (_DIAG_CM, -_DIAG_CM),
+    "south-west": (-_DIAG_CM, -_DIAG_CM)
+}
+# Directions walk() accepts, for callers that validate input before walking
+DIRECTIONS = tuple(_DIR_STEP)
+# Cardinal directions: indexed by (dx > 0) for x-dominant, 2 + (dy > 0) for y-dominant
+_CARDINALS = ("west", "east", "south", "north")
+
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
 class NavigationSystem:
     """
     Manages robot navigation, location tracking and spatial awareness.
     """
 
+    __slots__ = ('_room_width', '_room_length', 'centre', '_x', '_y', 'facing_angle',
+                 'height', '_width', '_safe_distance', '_bounds', '_bay_x', '_bay_y',
+                 '_storage_range', '_storage_range_sq', '_objects', '_objects_view', '_stored_mask',
+                 '_stored_count', '_obj_ids', '_obj_x', '_obj_y', '_x_order', '_x_sorted',
+                 '_epoch', '_cache_epoch', '_nearby_cache', '_steps_cache', '_storage_steps')
+
     # initialisation
     def __init__(self, room_dimensions: Tuple[float, float] = (1000, 1000)):
         """
         Initialise the navigation system with room setup and object tracking.
         Args: room_dimensions - Width and length of room in centimetres
         """
-        # Room setup
-        self.room_width, self.room_length = room_dimensions
-        self.centre = (self.room_width / 2, self.room_length / 2)
+        # Room setup; the room and robot sizes below are read-only as _bounds depends on them
+        self._room_width, self._room_length = room_dimensions
+        self.centre = (self._room_width / 2, self._room_length / 2)
 
         # Robot's current state
-        self.position = list(self.centre)
+        self._x, self._y = self.centre  # Updated in place by walk()
         self.facing_angle = 0
 
         # Robot's physical dimensions
         self.height = 173  # Tesla Optimus height in centimetres
-        self.width = 60   # Shoulder width in centimetres
-        self.safe_distance = 100  # Minimum safe distance in centimetres
+        self._width = 60   # Shoulder width in centimetres
+        self._safe_distance = 100  # Minimum safe distance in centimetres
+
+        # Reachable area: the robot's half-width plus safe distance from every wall,
+        # as (x_min, x_max, y_min, y_max). For the default room this is 130..870,
+        # inside SafetyController's 100..900 barriers, so navigation never walks
+        # the robot into a barrier violation
+        margin = self._width / 2 + self._safe_distance
+        self._bounds = (margin, self._room_width - margin, margin, self._room_length - margin)
 
         # Storage bay is positioned in top-right corner
-        self.storage_bay = [800.0, 800.0]
-        self.storage_range = 50  # Distance within which storage is possible
+        self._bay_x, self._bay_y = 800.0, 800.0
+        self.storage_range = 50  # Distance within which storage is possible; sets the square too
 
         # Object management
-        self.objects: Dict[int, List[float]] = {
-            1: [300.0, 300.0],  # Bottom left quadrant
-            2: [700.0, 700.0],  # Top right quadrant
-            3: [300.0, 700.0]   # Top left quadrant
+        self._objects: Dict[int, Tuple[float, float]] = {
+            1: (300.0, 300.0),  # Bottom left quadrant
+            2: (700.0, 700.0),  # Top right quadrant
+            3: (300.0, 700.0)   # Top left quadrant
         }
-        self.stored_objects: List[int] = []
+        self._objects_view = MappingProxyType(self._objects)  # Live, read-only
+        self._stored_mask = 0  # Bit n set once the object in column n is stored
+        self._stored_count = 0
+
+        # Object IDs and coordinates mirrored column-wise for distance scans, in the
+        # same order as the objects dict; add_object() keeps the two in step
+        self._obj_ids = array('q', self._objects)
+        self._obj_x = array('d', (pos[0] for pos in self._objects.values()))
+        self._obj_y = array('d', (pos[1] for pos in self._objects.values()))
+        self._index_objects()
+
+        # Query caches, valid while _cache_epoch matches _epoch. Moving the robot
+        # or changing the objects bumps _epoch, which empties them on next use
+        self._epoch = 0
+        self._cache_epoch = 0
+        self._nearby_cache: Dict[float, Dict[int, float]] = {}  # By max_distance
+        self._steps_cache: Dict[int, Tuple[str, int]] = {}  # By object ID
+        self._storage_steps: Optional[Tuple[str, int]] = None
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """
+        Get the robot's current position.
+        Returns: tuple - (x, y) in centimetres
+        """
+        return (self._x, self._y)
+
+    @position.setter
+    def position(self, position: Sequence[float]) -> None:
+        """
+        Place the robot at a new position.
+        Args: position - New [x, y] position in centimetres
+        """
+        self._x, self._y = position
+        self._epoch += 1
+
+    @property
+    def room_width(self) -> float:
+        """
+        Get the room width.
+        Returns: float - Width in centimetres
+        """
+        return self._room_width
+
+    @property
+    def room_length(self) -> float:
+        """
+        Get the room length.
+        Returns: float - Length in centimetres
+        """
+        return self._room_length
+
+    @property
+    def width(self) -> float:
+        """
+        Get the robot's shoulder width.
+        Returns: float - Width in centimetres
+        """
+        return self._width
+
+    @property
+    def safe_distance(self) -> float:
+        """
+        Get the minimum distance the robot keeps from the walls.
+        Returns: float - Distance in centimetres
+        """
+        return self._safe_distance
+
+    @property
+    def objects(self) -> Mapping[int, Tuple[float, float]]:
+        """
+        Get a read-only view of the objects in the room.
+        Use add_object() to change it, so the distance columns stay in step.
+        Returns: mapping - (x, y) position in centimetres for each object ID
+        """
+        return self._objects_view
+
+    @property
+    def storage_bay(self) -> Tuple[float, float]:
+        """
+        Get the storage bay location.
+        Returns: tuple - (x, y) in centimetres
+        """
+        return (self._bay_x, self._bay_y)
+
+    @property
+    def storage_range(self) -> float:
+        """
+        Get the distance from the storage bay within which objects can be stored.
+        Returns: float - Range in centimetres
+        """
+        return self._storage_range
+
+    @storage_range.setter
+    def storage_range(self, storage_range: float) -> None:
+        """
+        Set the storage range, keeping the squared range used by is_at_storage_bay in step.
+        Args: storage_range - Range in centimetres
+        """
+        self._storage_range = storage_range
+        self._storage_range_sq = storage_range * storage_range
 
     # navigation helpers
-    def _get_direction(self, dx: float, dy: float) -> str:
-        """Convert coordinate differences to compass direction."""
-        if dx > 0 and dy > 0:
-            return "north-east"
-        elif dx > 0 and dy < 0:
-            return "south-east"
-        elif dx < 0 and dy > 0:
-            return "north-west"
-        else: return "south-west"
+    @staticmethod
+    def _get_direction(dx: float, dy: float) -> str:
+        """Convert coordinate differences to diagonal compass direction."""
+        return _DIAGONALS[(dx > 0) + 2 * (dy > 0)]
 
     def get_steps_to_object(self, obj_id: int) -> Optional[Tuple[str, int]]:
-        """Calculate direction and steps to reach a specific object."""
-        obj_pos = self.objects.get(obj_id)
+        """
+        Calculate direction and steps to reach a specific object.
+        Args: obj_id - ID of the object to reach
+        Returns: tuple - (direction, steps), or None if the object is unknown
+        """
+        self._sync_caches()
+        cache = self._steps_cache
+        steps = cache.get(obj_id)
+        if steps is not None:
+            return steps
+
+        obj_pos = self._objects.get(obj_id)
         if not obj_pos:
             return None
 
-        dx = obj_pos[0] - self.position[0]
-        dy = obj_pos[1] - self.position[1]
+        steps = self._steps_for(obj_pos[0] - self._x, obj_pos[1] - self._y)
+        cache[obj_id] = steps
+        return steps
+
+    def get_steps_to_objects(self) -> Dict[int, Tuple[str, int]]:
+        """
+        Calculate direction and steps to every object in one pass.
+        The result is also the cache for this position, so it must not be modified.
+        Returns: dict - (direction, steps) for each object ID, in object order
+        """
+        self._sync_caches()
+        cache = self._steps_cache
+        px, py = self._x, self._y
+        steps_for = self._steps_for
+        steps = {obj_id: cache.get(obj_id) or steps_for(x - px, y - py)
+                 for obj_id, x, y in zip(self._obj_ids, self._obj_x, self._obj_y)}
+        self._steps_cache = steps
+        return steps
 
+    def _sync_caches(self) -> None:
+        """
+        Empty the query caches if the robot or the objects have changed since they were filled.
+        """
+        if self._cache_epoch != self._epoch:
+            self._cache_epoch = self._epoch
+            self._nearby_cache = {}
+            self._steps_cache = {}
+            self._storage_steps = None
+
+    @staticmethod
+    def _steps_for(dx: float, dy: float) -> Tuple[str, int]:
+        """Convert an offset to an object into a direction and step count."""
         # Calculate direction based on dominant axis
-        if abs(dx) > abs(dy):
-            return "east" if dx > 0 else "west", int(abs(dx) / 10)
-        elif abs(dy) > abs(dx):
-            return "north" if dy > 0 else "south", int(abs(dy) / 10)
+        abs_dx, abs_dy = abs(dx), abs(dy)
+        if abs_dx > abs_dy:
+            return _CARDINALS[dx > 0], int(abs_dx / 10)
+        elif abs_dy > abs_dx:
+            return _CARDINALS[2 + (dy > 0)], int(abs_dy / 10)
         else:  # Diagonal movement
-            if dx > 0 and dy > 0:
-                return "north-east", int(math.sqrt(dx**2 + dy**2) / 10)
-            elif dx > 0 and dy < 0:
-                return "south-east", int(math.sqrt(dx**2 + dy**2) / 10)
-            elif dx < 0 and dy > 0:
-                return "north-west", int(math.sqrt(dx**2 + dy**2) / 10)
-            else:
-                return "south-west", int(math.sqrt(dx**2 + dy**2) / 10)
+            return _DIAGONALS[(dx > 0) + 2 * (dy > 0)], int(math.hypot(dx, dy) / 10)
 
     def get_steps_to_storage(self) -> Tuple[str, int]:
         """Calculate direction and steps to reach storage bay."""
-        dx = self.storage_bay[0] - self.position[0]
-        dy = self.storage_bay[1] - self.position[1]
+        self._sync_caches()
+        if self._storage_steps is None:
+            self._storage_steps = self._steps_to_storage()
+        return self._storage_steps
+
+    def _steps_to_storage(self) -> Tuple[str, int]:
+        """Work out the direction and steps to the storage bay from the current position."""
+        dx = self._bay_x - self._x
+        dy = self._bay_y - self._y
 
         # Calculate steps first
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.hypot(dx, dy)
         steps = int(distance / 10)  # Each step is 10 centimetres
 
         # Determine direction based on dominant axis
         # If one axis is much larger than the other, use cardinal direction
-        if abs(dx) > abs(dy) * 1.5:  # Significantly more horizontal movement
-            return "east" if dx > 0 else "west", steps
-        elif abs(dy) > abs(dx) * 1.5:  # Significantly more vertical movement
-            return "north" if dy > 0 else "south", steps
+        abs_dx, abs_dy = abs(dx), abs(dy)
+        if abs_dx > abs_dy * 1.5:  # Significantly more horizontal movement
+            return _CARDINALS[dx > 0], steps
+        elif abs_dy > abs_dx * 1.5:  # Significantly more vertical movement
+            return _CARDINALS[2 + (dy > 0)], steps
         else:  # Truly diagonal movement
-            if dx > 0 and dy > 0:
-                return "north-east", steps
-            elif dx > 0 and dy < 0:
-                return "south-east", steps
-            elif dx < 0 and dy > 0:
-                return "north-west", steps
-            else:
-                return "south-west", steps
+            return _DIAGONALS[(dx > 0) + 2 * (dy > 0)], steps
 
     def get_nearby_objects(self, max_distance: float = 200) -> Dict[int, float]:
-        """Find available objects within specified distance."""
+        """
+        Find available objects within specified distance.
+        Results are cached until the robot moves or an object is stored, so the
+        returned dict is shared and must not be modified by callers.
+        """
+        self._sync_caches()
+        nearby = self._nearby_cache.get(max_distance)
+        if nearby is None:
+            nearby = self._scan_nearby(max_distance)
+            self._nearby_cache[max_distance] = nearby
+        return nearby
+
+    def _scan_nearby(self, max_distance: float) -> Dict[int, float]:
+        """
+        Find available objects within max_distance using the x-sorted index.
+        Args: max_distance - Search radius in centimetres
+        Returns: dict - Distance to each object in range, in object order
+        """
+        px, py = self._x, self._y
+        stored = self._stored_mask
+        limit_sq = max_distance * max_distance
+        obj_ids, obj_x, obj_y = self._obj_ids, self._obj_x, self._obj_y
+        sqrt = math.sqrt  # Local lookup inside the loop
+
         nearby = {}
-        for obj_id, pos in self.get_available_objects().items():
-            distance = math.sqrt(
-                (pos[0] - self.position[0])**2 +
-                (pos[1] - self.position[1])**2
-            )
-            if distance <= max_distance:
-                nearby[obj_id] = distance
+        for index in self._columns_in_x_range(px - max_distance, px + max_distance):
+            if stored >> index & 1:
+                continue
+            x, y = obj_x[index], obj_y[index]
+            # Filter on squared distance; only objects in range need the sqrt
+            dist_sq = (x - px) * (x - px) + (y - py) * (y - py)
+            if dist_sq <= limit_sq:
+                nearby[obj_ids[index]] = sqrt(dist_sq)
         return nearby
 
+    def _columns_in_x_range(self, x_lo: float, x_hi: float) -> List[int]:
+        """
+        Find the objects whose x coordinate lies in a range, using the x-sorted index.
+        Args: x_lo - Lowest x coordinate in centimetres
+              x_hi - Highest x coordinate in centimetres
+        Returns: list - Column indices in column order, so results keep the object table's order
+        """
+        lo = bisect_left(self._x_sorted, x_lo)
+        hi = bisect_right(self._x_sorted, x_hi)
+        return sorted(self._x_order[lo:hi])
+
     # movement and safety
     def is_movement_safe(self, target_x: float, target_y: float, carrying_object: bool = False) -> bool:
         """
         Determine if movement to target position is safe.
         """
-        # Check room boundaries
-        if not (0 <= target_x <= self.room_width and
-                0 <= target_y <= self.room_length):
+        # Check room boundaries, keeping clear of the walls
+        x_min, x_max, y_min, y_max = self._bounds
+        if not (x_min <= target_x <= x_max and y_min <= target_y <= y_max):
             return False
 
         # When carrying an object, prevent moving away from storage bay
-        if carrying_object and not self.is_at_storage_bay(self.position):
-            # Calculate if we're moving closer to storage bay
-            current_distance = math.sqrt(
-                (self.storage_bay[0] - self.position[0])**2 +
-                (self.storage_bay[1] - self.position[1])**2
-            )
-            target_distance = math.sqrt(
-                (self.storage_bay[0] - target_x)**2 +
-                (self.storage_bay[1] - target_y)**2
-            )
+        if carrying_object and not self.is_at_storage_bay((self._x, self._y)):
+            # Calculate if we're moving closer to storage bay (squared distances
+            # order the same way, so no sqrt is needed)
+            current_dist_sq = (self._bay_x - self._x)**2 + (self._bay_y - self._y)**2
+            target_dist_sq = (self._bay_x - target_x)**2 + (self._bay_y - target_y)**2
             # Only allow movement that gets us closer to storage bay
-            if target_distance >= current_distance:
+            if target_dist_sq >= current_dist_sq:
                 return False
 
         return True
@@ -145,73 +342,123 @@ class NavigationSystem:
     def walk(self, direction: str, steps: int) -> bool:
         """
         Move in specified direction, adjusting for diagonal movement.
+        Returns: bool - True if moved, False for an unknown direction or unsafe target
         """
-        # Calculate step size (shorter for diagonal movement)
-        step_size = 10  # Base step size in centimetres
-        if "north" in direction and ("east" in direction or "west" in direction):
-            step_size = step_size / math.sqrt(2)
-
-        # Calculate movement
-        dx = dy = 0
-        if "north" in direction:
-            dy = steps * step_size
-        if "south" in direction:
-            dy = -steps * step_size
-        if "east" in direction:
-            dx = steps * step_size
-        if "west" in direction:
-            dx = -steps * step_size
-
-        target_x = self.position[0] + dx
-        target_y = self.position[1] + dy
+        step = _DIR_STEP.get(direction)
+        if step is None:
+            return False
+
+        # Diagonal steps are already shortened in the table
+        target_x = self._x + step[0] * steps
+        target_y = self._y + step[1] * steps
 
         if self.is_movement_safe(target_x, target_y):
-            self.position = [target_x, target_y]
+            self._x = target_x
+            self._y = target_y
+            self._epoch += 1
             return True
         return False
 
     # object and storage management
-    def is_at_storage_bay(self, position: List[float]) -> bool:
+    def _index_objects(self) -> None:
+        """
+        Rebuild the x-sorted index over the object columns.
+        Objects change rarely, so a full re-sort is cheaper than keeping a tree.
+        """
+        order = sorted(range(len(self._obj_x)), key=self._obj_x.__getitem__)
+        self._x_order = array('q', order)  # Column index of each sorted entry
+        self._x_sorted = array('d', (self._obj_x[index] for index in order))
+
+    def add_object(self, object_id: int, position: Sequence[float]) -> None:
+        """
+        Place a new object in the room, or move an existing one.
+        Args: object_id - ID of the object
+              position - Object [x, y] position in centimetres
+        """
+        x, y = position
+        if object_id in self._objects:
+            index = self._obj_ids.index(object_id)
+            self._obj_x[index] = x
+            self._obj_y[index] = y
+        else:
+            self._obj_ids.append(object_id)
+            self._obj_x.append(x)
+            self._obj_y.append(y)
+        self._objects[object_id] = (x, y)
+        self._index_objects()
+        self._epoch += 1
+
+    def is_at_storage_bay(self, position: Sequence[float]) -> bool:
         """
         Check if the given position is close enough to storage bay.
         
         """
-        distance = math.sqrt(
-            (position[0] - self.storage_bay[0])**2 +
-            (position[1] - self.storage_bay[1])**2
-        )
-        return distance <= self.storage_range
+        dist_sq = (position[0] - self._bay_x)**2 + (position[1] - self._bay_y)**2
+        return dist_sq <= self._storage_range_sq
 
     def store_object(self, object_id: int) -> bool:
         """
         Mark an object as stored and remove it from available objects.
         Returns True if all objects are now stored.
         """
-        if object_id not in self.stored_objects:
-            self.stored_objects.append(object_id)
-            return len(self.stored_objects) == len(self.objects)
+        if object_id in self._objects:
+            bit = 1 << self._obj_ids.index(object_id)
+            if not self._stored_mask & bit:
+                self._stored_mask |= bit
+                self._stored_count += 1
+                self._epoch += 1
+                return self._stored_count == len(self._objects)
         return False
 
-    def get_available_objects(self) -> Dict[int, List[float]]:
+    @property
+    def stored_objects(self) -> List[int]:
+        """
+        Get the IDs of objects already stored.
+        Returns: list - Stored object IDs, in object order
+        """
+        stored = self._stored_mask
+        return [obj_id for index, obj_id in enumerate(self._obj_ids) if stored >> index & 1]
+
+    def all_objects_stored(self) -> bool:
+        """
+        Check whether every object has been stored.
+        Returns: bool - True if no objects remain available
+        """
+        return self._stored_count == len(self._objects)
+
+    def available_count(self) -> int:
+        """
+        Count the objects not yet stored.
+        Returns: int - Number of available objects
+        """
+        return len(self._objects) - self._stored_count
+
+    def get_available_objects(self) -> Dict[int, Tuple[float, float]]:
         """Get list of objects not yet stored."""
-        return {obj_id: pos for obj_id, pos in self.objects.items()
-                if obj_id not in self.stored_objects}
+        stored = self._stored_mask
+        return {obj_id: pos for index, (obj_id, pos) in enumerate(self._objects.items())
+                if not stored >> index & 1}
 
     # ui
     def explain_workspace(self) -> None:
         """
         Provide clear explanation of the workspace and available objects.
         """
-        print(f"\nRoom size: {self.room_width/100:.0f}m x {self.room_length/100:.0f}m")
-        print("Robot at centre of room")
+        lines = [f"\nRoom size: {self.room_width/100:.0f}m x {self.room_length/100:.0f}m",
+                 "Robot at centre of room"]
 
-        available = self.get_available_objects()
-        if available:
-            print("\nAvailable Objects:")
-            for obj_id, pos in available.items():
-                direction, steps = self.get_steps_to_object(obj_id)
-                print(f"Object {obj_id}: {steps} steps {direction}")
+        # One pass over the object columns gives every object's steps; stored
+        # objects are filtered here rather than building the available dict
+        stored = self._stored_mask
+        object_lines = [f"Object {obj_id}: {steps} steps {direction}"
+                        for index, (obj_id, (direction, steps))
+                        in enumerate(self.get_steps_to_objects().items())
+                        if not stored >> index & 1]
+        if object_lines:
+            lines.append("\nAvailable Objects:")
+            lines.extend(object_lines)
 
-        print("\nStorage Bay: Located in the north-east corner")
         direction, steps = self.get_steps_to_storage()
-        print(f"Currently {steps} steps {direction} from robot")
+        lines.append("\nStorage Bay: Located in the north-east corner")
+        lines.append(f"Currently {steps} steps {direction} from robot")
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -11,6 +11,8 @@ class ObjectHandler(IGrippable):
     Implements IGrippable interface for object handling.
     """
 
+    __slots__ = ('_gripper_status', '_max_grip_force', '_current_force', '_object_held')
+
     def __init__(self):
         """
         Initialise object handler with default parameters.
@@ -3,14 +3,25 @@ Module for managing robot safety features and barrier functions.
 Contains the SafetyController class which ensures safe robot operation.
 """
 
+import logging
 from typing import List
 
+_LOG = logging.getLogger(__name__)
+
 class SafetyController:
     """
     Controls safety features and monitors operational boundaries.
     Implements safety barriers and emergency protocols.
     """
 
+    __slots__ = ('_barrier_functions', '_safety_status', '_emergency_stop')
+
+    # Safe boundaries as 100cm from the edges of a 1000x1000 workspace. These are hard
+    # limits; NavigationSystem plans within a tighter area that also allows for the
+    # robot's half-width, so in the default room its targets always pass these barriers
+    _SAFE_MIN = 100
+    _SAFE_MAX = 900
+
     def __init__(self):
         """
         Initialise the safety controller with default safety parameters.
@@ -42,6 +53,14 @@ class SafetyController:
         self._emergency_stop = True
         self._safety_status = False
 
+    def reset(self) -> bool:
+        """
+        Clear an emergency stop and rerun the initial safety checks.
+        Returns: bool - True if the system is safe again
+        """
+        self._emergency_stop = False
+        return self.initialise()
+
     def check_barriers(self, position: List[float]) -> bool:
         """
         Check if current position violates any safety barriers.
@@ -50,10 +69,7 @@ class SafetyController:
         """
         # Basic boundary checks
         x, y, z = position
-        # Consider safe boundaries as 100cm from edges
-        safe_min = 100
-        safe_max = 900  # For a 1000x1000 workspace
-
+        safe_min, safe_max = self._SAFE_MIN, self._SAFE_MAX
         return (safe_min <= x <= safe_max and
                 safe_min <= y <= safe_max and
                 safe_min <= z <= safe_max)
@@ -63,5 +79,6 @@ class SafetyController:
         Log a safety-related event.
         Args: event: Description of the safety event
         """
-        # This would log to a file in a real-world system
-        print(f"Safety Event: {event}")
+        # Handlers (e.g. a log file) are configured by the application; the message
+        # is only formatted if a handler accepts the record
+        _LOG.warning("Safety Event: %s", event)
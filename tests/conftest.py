@@ -0,0 +1,30 @@
+"""
+Shared pytest configuration for the robot test suite.
+"""
+
+# Importing the modules under test here loads them before any test module is
+# collected, so every test module's own imports are plain sys.modules lookups
+import pytest
+from src.commands import CommandProcessor
+from src.core import Robot
+from src.navigation import NavigationSystem
+
+# Every test gets its own objects: each costs microseconds to build, and sharing
+# them would make results depend on test order and worker distribution
+
+@pytest.fixture
+def robot():
+    # Provide a fresh, initialised robot instance for each test.
+    instance = Robot()
+    instance.initialise()
+    return instance
+
+@pytest.fixture
+def nav_system():
+    # Provide a navigation system instance for each test.
+    return NavigationSystem()
+
+@pytest.fixture
+def cmd_processor():
+    # Provide a command processor instance for each test.
+    return CommandProcessor()
@@ -2,34 +2,28 @@
 Basic tests to verify core robot system functionality.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 from src.core import Robot
 
-def main():
-    print("Testing Robot System Implementation...")
-    print("-" * 50)
-    
-    # Create robot instance
-    print("Creating robot instance...")
-    robot = Robot()
-    print(f"Robot created. Initial state: {robot.current_state}")
-    print(f"Is operational: {robot.is_operational}")
-    
-    # Try initialisation
-    print("\nInitialising robot...")
-    init_success = robot.initialise()
-    print(f"Initialisation successful: {init_success}")
-    print(f"New state: {robot.current_state}")
-    print(f"Is operational: {robot.is_operational}")
-    
-    # Test command validation
-    print("\nTesting command validation...")
-    test_commands = ["walk", "turn", "grasp", "invalid_command"]
-    for command in test_commands:
-        is_valid = robot.validate_command(command)
-        print(f"Command '{command}' is valid: {is_valid}")
+def test_initial_state():
+    # Verify a new robot starts idle and non-operational.
+    new_robot = Robot()
+    assert new_robot.current_state == "Idle", "Robot should start in Idle state"
+    assert not new_robot.is_operational, "Robot should start non-operational"
 
-if __name__ == "__main__":
-    main()
+def test_initialise():
+    # Verify initialisation makes the robot operational in the Idle state.
+    new_robot = Robot()
+    assert new_robot.initialise(), "Initialisation should succeed"
+    assert new_robot.current_state == "Idle", "Robot should stay in Idle state"
+    assert new_robot.is_operational, "Robot should be operational after initialisation"
+
+@pytest.mark.parametrize("cmd,expected", [
+    ("walk", True),
+    ("turn", True),
+    ("grasp", True),
+    ("invalid_command", False)
+], ids=["walk", "turn", "grasp", "invalid"])
+def test_validate(cmd, expected, robot):
+    # Verify command validation for an idle robot, from the conftest.py fixture.
+    assert robot.validate_command(cmd) is expected, f"Unexpected result for {cmd!r}"
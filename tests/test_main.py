@@ -3,34 +3,44 @@ Comprehensive test suite for humanoid robot control system.
 Tests all major components and their interactions using pytest.
 """
 
+import io
+import threading
+
 import pytest
-from src.core import Robot
-from src.navigation import NavigationSystem
-from src.commands import CommandProcessor
+from src.core import Robot, CMD_WALK, CMD_RELEASE
+from src.environment import (DIR_BACK, DIR_FRONT, DISTANCE_DIRECTIONS, EnvironmentMonitor,
+                             ScanResult)
+from src.interfaces import IGrippable, IMoveable, ISensing
+from src.main import handle_movement, handle_object_interaction, main
+from src.safety import SafetyController
+
+# Command words expected to pass and fail validation in the Idle state
+VALID_CMDS = frozenset({"walk", "turn", "grasp"})
+INVALID_CMDS = frozenset({"jump", ""})
+
+# Keys every scan result must carry, taken from the schema once at import
+EXPECTED_SCAN_KEYS = frozenset(ScanResult.__annotations__)
+
+# Target (x, y) and whether moving there is safe, for a robot at the room centre
+BOUNDARY_CASES = (
+    pytest.param(500, 500, True, id="centre"),
+    pytest.param(200, 200, True, id="within-bounds"),
+    pytest.param(0, 0, False, id="origin"),
+    pytest.param(1000, 1000, False, id="max-bounds")
+)
+
+# Target xs and ys while carrying: away from the storage bay, then towards it
+CARRY_TARGETS = ((200, 550), (200, 550))
 
 class TestRobotSystem:
     """
     Test suite covering all major system components.
     Each test method validates specific functionality with clear assert statements.
     """
-    
-    @pytest.fixture
-    def robot(self):
-        # Provide a fresh robot instance for each test.
-        return Robot()
-        
-    @pytest.fixture
-    def nav_system(self):
-        # Provide a navigation system instance for each test.
-        return NavigationSystem()
-        
-    @pytest.fixture
-    def cmd_processor(self):
-        # Provide a command processor instance for each test.
-        return CommandProcessor()
 
-    def test_robot_initialisation(self, robot):
+    def test_robot_initialisation(self):
         # Verify robot initialises in correct starting state.
+        robot = Robot()
         # Initial state checks
         assert robot.current_state == "Idle", "Robot should start in Idle state"
         assert not robot.is_operational, "Robot should start non-operational"
@@ -40,43 +50,250 @@ class TestRobotSystem:
         assert success, "Initialisation should succeed"
         assert robot.is_operational, "Robot should be operational after initialisation"
 
-    def test_command_validation(self, robot):
-        # Test command validation in different robot states.
-        robot.initialise()
-        
-        # Test valid commands in Idle state
-        assert robot.validate_command("walk"), "Walk should be valid in Idle state"
-        assert robot.validate_command("turn"), "Turn should be valid in Idle state"
-        assert robot.validate_command("grasp"), "Grasp should be valid in Idle state"
-        
-        # Test invalid commands
-        assert not robot.validate_command("jump"), "Invalid command should be rejected"
-        assert not robot.validate_command(""), "Empty command should be rejected"
+    @pytest.mark.parametrize("cmd", sorted(VALID_CMDS))
+    def test_command_validation(self, robot, cmd):
+        # Test commands allowed in the Idle state are accepted.
+        assert robot.validate_command(cmd), f"{cmd!r} should be valid in Idle state"
+
+    @pytest.mark.parametrize("cmd", sorted(INVALID_CMDS), ids=lambda cmd: cmd or "empty")
+    def test_invalid_command_rejected(self, robot, cmd):
+        # Test unknown and empty commands are rejected.
+        assert not robot.validate_command(cmd), f"{cmd!r} should be rejected"
+
+    def test_command_id_validation(self, robot):
+        # Test interned command IDs are validated like command words.
+        assert robot.validate_command_id(CMD_WALK), "Walk ID should be valid in Idle state"
+        assert not robot.validate_command_id(CMD_RELEASE), "Release ID needs Grasping state"
+        assert not robot.validate_command_id(-1), "Unknown ID should be rejected"
 
-    def test_navigation_boundaries(self, nav_system):
+    @pytest.mark.parametrize("x,y,expected", BOUNDARY_CASES)
+    def test_navigation_boundaries(self, nav_system, x, y, expected):
         # Test navigation system's boundary checking.
-        # Test safe positions
-        assert nav_system.is_movement_safe(500, 500), "Centre position should be safe"
-        assert nav_system.is_movement_safe(200, 200), "Position within bounds should be safe"
-        
-        # Test unsafe positions
-        assert not nav_system.is_movement_safe(0, 0), "Position at origin should be unsafe"
-        assert not nav_system.is_movement_safe(1000, 1000), "Position at max bounds should be unsafe"
+        assert nav_system.is_movement_safe(x, y) is expected, f"Unexpected safety for ({x}, {y})"
+
+    def test_navigation_boundaries_carrying(self, nav_system):
+        # Test only targets closer to the storage bay are allowed while carrying.
+        xs, ys = CARRY_TARGETS
+        assert [nav_system.is_movement_safe(x, y, True) for x, y in zip(xs, ys)] == [False, True]
+
+    def test_walk_directions(self, nav_system):
+        # Test diagonal steps are scaled both ways and unknown directions fail.
+        assert nav_system.walk("north-east", 20), "Diagonal walk should succeed"
+        assert nav_system.walk("south-west", 20), "Diagonal walk back should succeed"
+        assert list(nav_system.position) == pytest.approx([500.0, 500.0]), "Should return to start"
+
+        assert not nav_system.walk("up", 5), "Unknown direction should be rejected"
+        assert not nav_system.walk("sideways", 10), "Unknown direction should be rejected"
+        assert list(nav_system.position) == pytest.approx([500.0, 500.0]), \
+            "Position should not change"
+
+    @pytest.mark.parametrize("direction,offset", [
+        pytest.param("north-east", (70.711, 70.711), id="north-east"),
+        pytest.param("north-west", (-70.711, 70.711), id="north-west"),
+        pytest.param("south-east", (70.711, -70.711), id="south-east"),
+        pytest.param("south-west", (-70.711, -70.711), id="south-west")
+    ])
+    def test_diagonal_walk_distance(self, nav_system, direction, offset):
+        # Test every diagonal covers the same 10cm per step, south as well as north.
+        assert nav_system.walk(direction, 10), "Diagonal walk should succeed"
+        x, y = nav_system.position
+        assert (x - 500.0, y - 500.0) == pytest.approx(offset, abs=1e-3), \
+            "Should move 100cm diagonally"
+
+    def test_nearby_objects_cache(self, nav_system):
+        # Test cached nearby objects are refreshed after moving and storing.
+        assert nav_system.get_nearby_objects(max_distance=100) == {}, "Nothing near the centre"
+        nav_system.walk("north-east", 28)
+        nearby = nav_system.get_nearby_objects(max_distance=100)
+        assert 2 in nearby, "Object 2 should be in range after moving"
+        assert nav_system.get_nearby_objects(max_distance=100) is nearby, \
+            "Repeat call should hit cache"
+
+        nav_system.store_object(2)
+        assert 2 not in nav_system.get_nearby_objects(max_distance=100), \
+            "Stored object should drop out"
+
+    def test_store_objects(self, nav_system):
+        # Test storing tracks each object once and reports when all are stored.
+        assert not nav_system.store_object(2), "Objects remain after the first store"
+        assert not nav_system.store_object(2), "Storing twice should not count again"
+        assert not nav_system.store_object(9), "Unknown objects cannot be stored"
+        assert nav_system.stored_objects == [2], "Only the known object should be stored"
+        assert list(nav_system.get_available_objects()) == [1, 3]
+        assert nav_system.available_count() == 2, "Count should match the available objects"
+
+        nav_system.store_object(1)
+        assert nav_system.store_object(3), "Last object should complete the area"
+        assert nav_system.all_objects_stored(), "Every object should be stored"
+
+    def test_navigation_within_safety_barriers(self, nav_system):
+        # Test the navigable area is read-only and inside the safety barriers.
+        with pytest.raises(AttributeError):
+            nav_system.safe_distance = 0
+        x_min, x_max, y_min, y_max = nav_system._bounds
+        barriers = SafetyController()
+        for x, y in ((x_min, y_min), (x_max, y_max)):
+            assert nav_system.is_movement_safe(x, y), "Bounds are inclusive"
+            assert barriers.check_barriers([x, y, 500]), "Navigable corner should pass the barriers"
+
+    def test_storage_range(self, nav_system):
+        # Test changing the storage range changes what counts as at the bay.
+        assert not nav_system.is_at_storage_bay((800.0, 890.0)), "90cm away is out of range"
+        nav_system.storage_range = 100
+        assert nav_system.storage_range == 100, "Range should read back"
+        assert nav_system.is_at_storage_bay((800.0, 890.0)), "Wider range should reach 90cm"
+
+    def test_store_object_ids(self, nav_system):
+        # Test unknown, negative and very large IDs are handled without error.
+        assert not nav_system.store_object(-1), "Unknown negative ID cannot be stored"
+        assert not nav_system.store_object(10**18), "Unknown large ID cannot be stored"
+        assert nav_system.stored_objects == [], "Nothing should be stored"
+
+        nav_system.add_object(-4, [550.0, 500.0])
+        nav_system.add_object(10**12, [520.0, 500.0])
+        assert nav_system.get_nearby_objects(max_distance=100) == {-4: 50.0, 10**12: 20.0}
+        nav_system.store_object(-4)
+        assert nav_system.stored_objects == [-4], "Negative ID should be stored"
+        assert list(nav_system.get_available_objects()) == [1, 2, 3, 10**12]
+        assert nav_system.get_nearby_objects(max_distance=100) == {10**12: 20.0}
+
+    def test_add_object(self, nav_system):
+        # Test added and moved objects are found by distance scans.
+        nav_system.add_object(4, [550.0, 500.0])
+        assert nav_system.get_nearby_objects(max_distance=100) == {4: 50.0}, \
+            "New object should be in range"
+        assert nav_system.get_steps_to_object(4) == ("east", 5), "Steps should reach the new object"
+
+        nav_system.add_object(4, [900.0, 900.0])
+        assert nav_system.get_nearby_objects(max_distance=100) == {}, "Moved object should drop out"
+        assert nav_system.objects[4] == (900.0, 900.0), "Object table should follow the move"
+        with pytest.raises(TypeError):
+            nav_system.objects[4] = (500.0, 500.0)  # Only add_object() may change objects
+        assert nav_system.get_steps_to_object(4) == ("north-east", 56), \
+            "Cached steps should be refreshed"
+
+    def test_grasp_nearest_object(self, robot, nav_system):
+        # Test grasp picks the closest object in range, not the lowest ID.
+        nav_system.add_object(5, [560.0, 500.0])
+        nav_system.add_object(4, [520.0, 500.0])
+        handle_object_interaction(["grasp"], robot, nav_system)
+        assert robot.get_held_object() == 4, "Nearest object should be gripped"
+
+    def test_cli_keyword_must_stand_alone(self, monkeypatch, capsys):
+        # Test a keyword glued to other text is an unknown command, not the keyword.
+        script = "walk-east 5\nscan-foo\nhelp.\nwalk east 5\nquit\n"
+        monkeypatch.setattr("sys.stdin", io.StringIO(script))
+        main()
+        out = capsys.readouterr().out
+        assert out.count("Unknown command") == 3, "Glued keywords should be rejected"
+        assert "Cannot move there" not in out, "'walk-east' should not be read as walk"
+        assert "Moving 5 steps east" in out, "Separated arguments should still parse"
+
+    def test_cli_unknown_direction(self, robot, nav_system, monkeypatch, capsys):
+        # Test an unknown direction is reported as such, whether or not an object is held.
+        monkeypatch.setattr("sys.stdin", io.StringIO("walk up 3\nquit\n"))
+        main()
+        out = capsys.readouterr().out
+        assert "Unknown direction. Use one of: north," in out, "Valid directions should be listed"
+        assert "Cannot move" not in out, "An unknown direction is not a blocked path"
+
+        assert robot.grip_object(1), "Robot should grip the object"
+        handle_movement(["walk", "up", "3"], robot, nav_system)
+        out = capsys.readouterr().out
+        assert "Unknown direction" in out, "Carrying should not change the message"
+        assert "carrying" not in out, "An unknown direction is not a storage bay problem"
+        assert nav_system.position == (500.0, 500.0), "Robot should not move"
 
     def test_command_processing(self, cmd_processor):
-        # Test command queue and processing functionality.
-        # Test command enqueuing
-        assert cmd_processor.enqueue_command("walk to 500 500"), "Should accept valid command"
-        assert cmd_processor.queue_size() == 1, "Queue should have one command"
-        
-        # Test command processing
-        command = cmd_processor.process_next_command()
-        assert command == "walk to 500 500", "Should retrieve correct command"
+        # Test a batch of commands is queued and processed in FIFO order.
+        cmds = [f"walk to {i} {i}" for i in range(1024)]
+        assert all(cmd_processor.enqueue_command(c) for c in cmds), "Should accept every command"
+        assert cmd_processor.queue_size() == 1024, "Queue should hold the whole batch"
+
+        out = [cmd_processor.process_next_command() for _ in range(1024)]
+        assert out == cmds, "Commands should be processed in the order queued"
         assert cmd_processor.queue_size() == 0, "Queue should be empty after processing"
+        assert not any(cmd_processor._queue), "Processed commands should not stay referenced"
+
+        cmd_processor.enqueue_many(cmds[:20])
+        cmd_processor.clear_queue()
+        assert cmd_processor.queue_size() == 0, "Cleared queue should be empty"
+        assert not any(cmd_processor._queue), "Cleared commands should not stay referenced"
+
+    def test_enqueue_rejects_non_strings(self, cmd_processor):
+        # Test non-string commands are refused rather than raising.
+        assert not cmd_processor.enqueue_command(None), "None should be rejected"
+        assert not cmd_processor.enqueue_command(42), "Numbers should be rejected"
+        assert cmd_processor.enqueue_many(["scan", 42, "walk"]) == 2, \
+            "Only strings should be queued"
+        assert cmd_processor.queue_size() == 2, "Rejected commands should not be queued"
+
+    def test_command_batch_enqueue(self, cmd_processor):
+        # Test batch enqueue wraps around the ring and grows when needed.
+        cmd_processor.enqueue_many(["scan"] * 12)
+        for _ in range(12):
+            cmd_processor.process_next_command()
+
+        # First batch wraps past the end of the ring, second forces growth
+        batch = [f"walk {i}" for i in range(30)]
+        assert cmd_processor.enqueue_many(batch[:10]) == 10, "Should report commands queued"
+        assert cmd_processor.enqueue_many(batch[10:]) == 20, "Should report commands queued"
+        assert cmd_processor.queue_size() == 30, "Queue should hold both batches"
+        assert [cmd_processor.process_next_command() for _ in range(30)] == batch
+
+    def test_command_queue_growth(self, cmd_processor):
+        # Test ring buffer keeps FIFO order across wraparound and growth.
+        for i in range(10):
+            cmd_processor.enqueue_command(f"walk {i}")
+        for i in range(5):
+            assert cmd_processor.process_next_command() == f"walk {i}"
+
+        # Wrap the tail past the end, then force the buffer to double
+        for i in range(10, 40):
+            assert cmd_processor.enqueue_command(f"walk {i}"), "Should accept command"
+        assert cmd_processor.queue_size() == 35, "Queue should hold all pending commands"
+
+        processed = [cmd_processor.process_next_command() for _ in range(35)]
+        assert processed == [f"walk {i}" for i in range(5, 40)], "Order should be preserved"
+        assert cmd_processor.process_next_command() is None, "Queue should be empty"
+
+        # Operation stack grows alongside and pops in LIFO order
+        assert cmd_processor.stack_size() == 40, "Every processed command should be tracked"
+        assert cmd_processor.undo_last_operation() == "walk 39", "Undo should pop latest"
+        assert cmd_processor.get_operation_history()[-1] == "walk 38"
+        assert list(cmd_processor.iter_operation_history()) == cmd_processor.get_operation_history()
+
+    def test_command_queue_threads(self, cmd_processor):
+        # Test one producer and one consumer thread share the queue without loss.
+        commands = [f"walk {i}" for i in range(5000)]
+        received = []
+
+        def consume():
+            while len(received) < len(commands):
+                command = cmd_processor.process_next_command()
+                if command is not None:
+                    received.append(command)
+
+        consumer = threading.Thread(target=consume, daemon=True)  # Must not block exit if it hangs
+        consumer.start()
+        for command in commands:
+            cmd_processor.enqueue_command(command)
+        consumer.join(timeout=10)
+
+        assert not consumer.is_alive(), "Consumer should drain every command"
+        assert received == commands, "Commands should arrive once each, in order"
+
+    @pytest.mark.parametrize("interface", [IGrippable, IMoveable, ISensing],
+                             ids=lambda interface: interface.__name__)
+    def test_incomplete_interface_rejected(self, interface):
+        # Test a subclass implementing only one interface method cannot be instantiated.
+        implemented = min(interface.__abstractmethods__)
+        incomplete = type("Incomplete", (interface,), {implemented: lambda self: True})
+        with pytest.raises(TypeError):
+            incomplete()
 
     def test_object_handling(self, robot):
         # Test object gripping functionality.
-        robot.initialise()
         handler = robot._object_handler
         
         # Test gripping
@@ -88,37 +305,76 @@ class TestRobotSystem:
         assert handler.release(), "Release command should succeed"
         assert not handler._gripper_status, "Gripper should be open after release"
 
-    def test_safety_monitoring(self, robot):
-        # Test safety monitoring and barrier functions.
-        robot.initialise()
-        safety = robot._safety
-        
-        # Test safety status
-        assert safety.validate_safety(), "Should be safe after initialisation"
-        
-        # Test emergency stop
-        safety.trigger_emergency_stop()
-        assert not safety.validate_safety(), "Should be unsafe after emergency stop"
+        # Repeated cycles are checked once at the end
+        cycles = sum(handler.grip() and handler.release() for _ in range(10_000))
+        assert cycles == 10_000, "Every grip and release cycle should succeed"
+        assert handler._gripper_status is False, "Gripper should end open"
 
     def test_environment_monitoring(self, robot):
         # Test environment monitoring and sensor data processing.
-        robot.initialise()
         env = robot._environment
         
         # Test scanning
         scan_data = env.scan()
-        assert isinstance(scan_data, dict), "Scan should return dictionary"
-        assert "front_distance" in scan_data, "Scan should include front distance"
-        assert "obstacles_detected" in scan_data, "Scan should report obstacles"
+        assert EXPECTED_SCAN_KEYS <= scan_data.keys(), \
+            f"Scan is missing: {EXPECTED_SCAN_KEYS - scan_data.keys()}"
+
+        # Each recorded obstacle is counted once
+        env.add_obstacle([200.0, 300.0, 0.0])
+        env.add_obstacle([400.0, 500.0, 0.0])
+        assert env.scan()["obstacles_detected"] == 2, "Scan should count recorded obstacles"
+
+    def test_distance_measurement(self):
+        # Test distance readings by index and by name, and how the buffer is shared.
+        env = EnvironmentMonitor()
+        dist = env.measure_distances()
+        assert list(dist) == [100.0] * len(DISTANCE_DIRECTIONS), "One reading per direction"
+        assert env.measure_distances_dict() == dict.fromkeys(DISTANCE_DIRECTIONS, 100.0)
+
+        # Every call refreshes and returns the same buffer, so snapshots must be copies
+        snapshot = dist.tolist()
+        dist[DIR_FRONT] = 0.0
+        assert snapshot[DIR_FRONT] == 100.0, "A copied snapshot should keep its readings"
+        assert env.measure_distances() is dist, "The buffer should be reused"
+        assert dist[DIR_FRONT] == 100.0, "A new measurement should overwrite the buffer"
+
+        # The dict is built fresh, so changing it leaves the buffer alone
+        named = env.measure_distances_dict()
+        named["back"] = 0.0
+        assert dist[DIR_BACK] == 100.0, "The dict should not alias the buffer"
+
+    @pytest.mark.parametrize("actions,expected", [
+        ([], True),
+        (["trigger_emergency_stop"], False),
+        (["trigger_emergency_stop", "reset"], True)
+    ], ids=["no-actions", "stopped", "stopped-then-reset"])
+    def test_safety_monitoring(self, robot, actions, expected):
+        # Test safety status after each sequence of safety actions.
+        safety = robot._safety
+        for action in actions:
+            getattr(safety, action)()
+        assert safety.validate_safety() is expected, f"Unexpected safety after {actions}"
 
     def test_movement_execution(self, robot):
         # Test movement commands and position updates.
-        robot.initialise()
         
         # Test basic movement
-        initial_pos = robot._current_position.copy()
+        assert robot._motion._is_moving is False, "Robot should start stationary"
         robot._motion.walk("forward")
         assert robot._motion._is_moving, "Robot should be moving"
         
         robot._motion.stop()
-        assert not robot._motion._is_moving, "Robot should stop when commanded"
\ No newline at end of file
+        assert not robot._motion._is_moving, "Robot should stop when commanded"
+    def test_pose_views(self):
+        # Test position and orientation are zeroed three-element views over one pose buffer.
+        robot = Robot()
+        position, orientation = robot.position, robot.orientation
+        assert position.tolist() == [0.0, 0.0, 0.0], "Position should start at the origin"
+        assert orientation.tolist() == [0.0, 0.0, 0.0], "Orientation should start level"
+        assert position.shape == orientation.shape == (3,), "Each view should hold 3 values"
+
+        # Writes through either view land in the shared pose buffer
+        position[0] = 120.0
+        orientation[2] = 90.0
+        assert robot._pose.tolist() == [120.0, 0.0, 0.0, 0.0, 0.0, 90.0]
+        assert robot.position[0] == 120.0, "A new view should see the write"
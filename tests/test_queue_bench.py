@@ -0,0 +1,95 @@
+"""
+Micro-benchmarks for the command queue.
+Opt-in and needs pytest-benchmark; run with: python -m pytest -m bench
+"""
+
+import threading
+from statistics import quantiles
+from time import perf_counter_ns
+
+import pytest
+from src.commands import CommandProcessor
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.bench  # Deselected by default in pytest.ini
+
+SIZES = [1000, 10000, 100000]
+THROUGHPUT_ITEMS = 100000
+
+def _enqueue(n):
+    # Fill a new processor so every round starts from the initial capacity.
+    processor = CommandProcessor()
+    enqueue = processor.enqueue_command
+    for _ in range(n):
+        enqueue("walk")
+    return processor
+
+def _drain(processor, n):
+    # Process n queued commands.
+    process = processor.process_next_command
+    for _ in range(n):
+        process()
+
+@pytest.mark.benchmark(group="cmd_queue")
+@pytest.mark.parametrize("n", SIZES)
+def test_enqueue_throughput(benchmark, n):
+    # Measure enqueueing n commands one at a time.
+    processor = benchmark(_enqueue, n)
+    assert processor.queue_size() == n, "Every command should be queued"
+
+@pytest.mark.benchmark(group="cmd_queue")
+@pytest.mark.parametrize("n", SIZES)
+def test_dequeue_throughput(benchmark, n):
+    # Measure processing n commands; the queue is refilled outside the timing.
+    processors = []
+
+    def setup():
+        processors.append(_enqueue(n))
+        return (processors[-1], n), {}
+
+    benchmark.pedantic(_drain, setup=setup, rounds=5)
+    assert processors[-1].queue_size() == 0, "Every command should be processed"
+
+def _produce_consume(commands):
+    # Pass commands from a producer thread to a consumer thread, stamping each end.
+    processor = CommandProcessor()
+    n = len(commands)
+    sent = [0] * n
+    received = [0] * n
+
+    def consume():
+        process = processor.process_next_command
+        i = 0
+        while i < n:
+            if process() is not None:
+                received[i] = perf_counter_ns()  # FIFO, so the i-th out is the i-th in
+                i += 1
+
+    consumer = threading.Thread(target=consume, daemon=True)  # Must not block exit if it hangs
+    consumer.start()
+    enqueue = processor.enqueue_command
+    for i, command in enumerate(commands):
+        sent[i] = perf_counter_ns()
+        enqueue(command)
+    consumer.join(timeout=60)
+    assert not consumer.is_alive(), "Consumer should drain every command"
+    return sent, received
+
+@pytest.mark.benchmark(group="queue_throughput")
+def test_threaded_throughput(benchmark):
+    # Measure one producer and one consumer thread sharing the queue.
+    commands = [f"walk {i}" for i in range(THROUGHPUT_ITEMS)]
+    sent, received = benchmark.pedantic(_produce_consume, args=(commands,), rounds=3)
+
+    # Latency percentiles and throughput of the last round, reported with the results
+    latencies = [end - start for start, end in zip(sent, received)]
+    cuts = quantiles(latencies, n=100)
+    elapsed_ns = received[-1] - sent[0]
+    benchmark.extra_info.update({
+        "ops_per_sec": THROUGHPUT_ITEMS * 1e9 / elapsed_ns,
+        "p50_ns": cuts[49],
+        "p90_ns": cuts[89],
+        "p99_ns": cuts[98]
+    })
+    assert min(latencies) >= 0, "Every command should be received after it was sent"